@@ -1,17 +1,81 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, jsonify, request, stream_template, stream_with_context
+import atexit
+import gzip
+import os
 import sqlite3
 import hashlib
+import json
+import threading
+import time
 from datetime import datetime
 import pandas as pd
 
+# Rows per chunk written by the streamed JSON endpoint
+JSON_BATCH_ROWS = 500
+# Size in characters of the chunks the streamed HTML page is written in
+HTML_CHUNK_SIZE = 16384
+# Seconds a status or note change waits so edits arriving together
+# share one commit
+UPDATE_FLUSH_INTERVAL = 0.25
+# Seconds before a failed flush is retried
+UPDATE_RETRY_DELAY = 5
+# Re-ANALYZE once the table has grown by this fraction since the last run
+STATS_REFRESH_RATIO = 0.1
+# Fields add_resources reads from each resource, in INSERT order
+RESOURCE_FIELDS = ('title', 'company', 'url', 'description', 'date_posted', 'source')
+_encode_json = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+def _digest(unique_string):
+    """128-bit dedupe key; SHA-256 uses the CPU's SHA extensions where available"""
+    return hashlib.sha256(unique_string.encode()).digest()[:16].hex()
+
+def _resource_key(title, company, description):
+    return _digest(title.lower().strip() + company.lower().strip() +
+                   description.lower().strip())
+
 class resourceDatabase:
+    # SQLite allows one writer per file. Writers in this process queue on a
+    # lock instead of spinning in SQLite's busy handler; the lock is shared
+    # by every instance because several of them open the same file.
+    _write_lock = threading.Lock()
+    # One constant string, so sqlite3's per-connection statement cache
+    # reuses the compiled query across calls and methods.
+    _SELECT_ALL_SQL = "SELECT * FROM resources ORDER BY date_added DESC"
+    _VERSION_SQL = "SELECT version FROM resources_version WHERE id = 1"
+    _UPDATE_STATUS_SQL = "UPDATE resources SET status = ? WHERE id = ?"
+    _UPDATE_NOTES_SQL = "UPDATE resources SET notes = ? WHERE id = ?"
+    
     def __init__(self, db_path="resources.db"):
         self.db_path = db_path
+        self._tls = threading.local()
+        # Latest unsaved status and note per resource id, written by
+        # flush_updates()
+        self._pending_status = {}
+        self._pending_notes = {}
+        self._pending_lock = threading.Lock()
+        self._flush_wanted = threading.Event()
+        self._flusher = None
+        atexit.register(self.flush_updates)
         self.init_db()
     
+    def _conn(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            # Writers from another process or thread wait instead of failing
+            # with "database is locked".
+            conn.execute("PRAGMA busy_timeout=60000")
+            self._tls.conn = conn
+        return conn
+    
     def init_db(self):
         """Initialize the database with necessary tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         c = conn.cursor()
         
         # Create resources table
@@ -30,102 +94,324 @@ class resourceDatabase:
                 notes TEXT
             )
         ''')
+        # Lets the newest-first listings walk the index instead of sorting
+        c.execute("CREATE INDEX IF NOT EXISTS idx_resources_date_added ON resources(date_added)")
+        
+        # Single-row counter bumped by triggers on every change to resources,
+        # from any connection or process, so cached pages can tell whether
+        # they are stale.
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS resources_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+            )
+        ''')
+        c.execute("INSERT OR IGNORE INTO resources_version (id, version) VALUES (1, 0)")
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            c.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS resources_version_{event.lower()}
+                AFTER {event} ON resources BEGIN
+                    UPDATE resources_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
         
+        self._migrate_hashes(conn)
         conn.commit()
-        conn.close()
+    
+    def _migrate_hashes(self, conn):
+        """Rewrite resource_hash for rows stored with the old MD5 key"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(resources)")}
+        if 'resource_hash' not in columns:
+            return
+        sample = conn.execute(
+            "SELECT title, company, description, resource_hash FROM resources "
+            "WHERE resource_hash IS NOT NULL LIMIT 1").fetchone()
+        if sample is None:
+            return
+        unique_string = ''.join((v or '').lower().strip() for v in sample[:3])
+        if sample[3] != hashlib.md5(unique_string.encode()).hexdigest():
+            return
+        rows = conn.execute(
+            "SELECT id, title, company, description FROM resources "
+            "WHERE resource_hash IS NOT NULL").fetchall()
+        conn.executemany(
+            "UPDATE resources SET resource_hash = ? WHERE id = ?",
+            [(_digest(''.join((v or '').lower().strip() for v in row[1:])), row[0])
+             for row in rows])
     
     def generate_resource_hash(self, resource):
         """Create a unique hash for resource deduplication"""
-        # Combine title and company to create unique identifier
-        unique_string = (f"{resource['title'].lower().strip()}"
-                        f"{resource['company'].lower().strip()}"
-                        f"{resource['description'].lower().strip()}")
-        return hashlib.md5(unique_string.encode()).hexdigest()
-    
-    def add_resources(self, resources_df):
-        """Add new resources to database with deduplication"""
-        conn = sqlite3.connect(self.db_path)
-        new_resources = 0
-        duplicates = 0
+        # Combine title, company and description to create unique identifier
+        return _resource_key(resource['title'], resource['company'],
+                             resource['description'])
+    
+    def add_resources(self, resources):
+        """Add new resources to database with deduplication
         
-        for _, resource in resources_df.iterrows():
-            resource_hash = self.generate_resource_hash(resource)
-            
-            # Check if resource already exists
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM resources WHERE resource_hash = ?", (resource_hash,))
-            exists = cursor.fetchone()
-            
-            if not exists:
-                try:
-                    cursor.execute("""
-                        INSERT INTO resources (
-                            title, company, url, description,
-                            date_posted, source, date_added, resource_hash
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        resource['title'],
-                        resource['company'],
-                        resource['url'],
-                        resource['description'],
-                        resource['date_posted'],
-                        resource['source'],
-                        datetime.now().isoformat(),
-                        resource_hash
-                    ))
-                    new_resources += 1
-                except sqlite3.IntegrityError:
-                    duplicates += 1
-            else:
-                duplicates += 1
+        resources may be a list of dicts or a DataFrame with RESOURCE_FIELDS.
+        """
+        # Pandas' .str methods cost more than the hashing itself, so plain
+        # Python strings are normalized row by row instead.
+        if isinstance(resources, pd.DataFrame):
+            if resources.empty:
+                return 0, 0
+            records = zip(*(resources[field].tolist() for field in RESOURCE_FIELDS))
+        else:
+            records = (tuple(r[field] for field in RESOURCE_FIELDS) for r in resources)
+        now = datetime.now().isoformat()
+        rows = [(title, company, url, description, date_posted, source, now,
+                 _resource_key(title, company, description))
+                for title, company, url, description, date_posted, source in records]
+        if not rows:
+            return 0, 0
         
-        conn.commit()
-        conn.close()
-        return new_resources, duplicates
+        # One executemany in a single transaction; the UNIQUE url and
+        # resource_hash columns drop duplicates without a SELECT per row.
+        conn = self._conn()
+        with self._write_lock:
+            cursor = conn.executemany("""
+                INSERT OR IGNORE INTO resources (
+                    title, company, url, description,
+                    date_posted, source, date_added, resource_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            new_resources = cursor.rowcount
+            conn.commit()
+            if new_resources:
+                self._refresh_stats(conn)
+        return new_resources, len(rows) - new_resources
+    
+    def _refresh_stats(self, conn):
+        """ANALYZE resources when it has grown noticeably since the last run"""
+        # sqlite_stat1 records the row count each index was analyzed at.
+        # Rows are never deleted, so max(rowid) tracks the current size
+        # with one index lookup. Re-scanning only after STATS_REFRESH_RATIO
+        # growth keeps the cost proportional to the rows inserted, however
+        # small the individual loads.
+        try:
+            row = conn.execute("SELECT stat FROM sqlite_stat1 "
+                               "WHERE tbl = 'resources' LIMIT 1").fetchone()
+        except sqlite3.OperationalError:
+            # sqlite_stat1 only exists once something has been analyzed
+            row = None
+        analyzed_rows = int(row[0].split()[0]) if row else 0
+        current_rows = conn.execute("SELECT max(rowid) FROM resources").fetchone()[0] or 0
+        if current_rows - analyzed_rows >= analyzed_rows * STATS_REFRESH_RATIO:
+            conn.execute("ANALYZE resources")
+    
+    @property
+    def write_gen(self):
+        """Counter that changes whenever anything writes to resources"""
+        return self._conn().execute(self._VERSION_SQL).fetchone()[0]
     
     def get_all_resources(self):
         """Retrieve all resources from database"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("""
-            SELECT * FROM resources 
-            ORDER BY date_added DESC
-        """, conn)
-        conn.close()
+        conn = self._conn()
+        df = pd.read_sql_query(self._SELECT_ALL_SQL, conn)
         return df
     
+    def iter_resources(self):
+        """Yield resources one row at a time, newest first"""
+        cursor = self._conn().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(self._SELECT_ALL_SQL)
+        for row in cursor:
+            yield dict(row)
+    
     def update_resource_status(self, resource_id, status):
-        """Update resource status (new, interested, applied, rejected)"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("UPDATE resources SET status = ? WHERE id = ?", (status, resource_id))
-        conn.commit()
-        conn.close()
+        """Queue a status change (new, interested, applied, rejected)"""
+        self._queue_update('status', resource_id, status)
     
     def add_resource_note(self, resource_id, note):
-        """Add a note to a resource"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("UPDATE resources SET notes = ? WHERE id = ?", (note, resource_id))
-        conn.commit()
-        conn.close()
+        """Queue a note for a resource"""
+        self._queue_update('notes', resource_id, note)
+    
+    def _queue_update(self, field, resource_id, value):
+        # The pending dict is looked up under the lock, because
+        # flush_updates() swaps in fresh ones while holding it. Only the
+        # newest value per resource is kept.
+        with self._pending_lock:
+            pending = self._pending_status if field == 'status' else self._pending_notes
+            pending[resource_id] = value
+            if self._flusher is None:
+                # A single long-lived thread does every flush, so its
+                # connection is opened once and reused.
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flusher.start()
+        self._flush_wanted.set()
+    
+    def _flush_loop(self):
+        while True:
+            self._flush_wanted.wait()
+            # Let changes arriving close together share one commit
+            time.sleep(UPDATE_FLUSH_INTERVAL)
+            self._flush_wanted.clear()
+            try:
+                saved = self.flush_updates()
+            except Exception as e:
+                # Nothing restarts this thread, so it must outlive any error
+                print(f"Error saving queued updates: {e}")
+                saved = False
+            if not saved:
+                time.sleep(UPDATE_RETRY_DELAY)
+                self._flush_wanted.set()
+    
+    def flush_updates(self):
+        """Write every queued status change and note in a single transaction
+        
+        Returns False if the database was locked or unavailable; the changes
+        stay queued. Rows SQLite rejects are logged and dropped.
+        """
+        with self._pending_lock:
+            status, self._pending_status = self._pending_status, {}
+            notes, self._pending_notes = self._pending_notes, {}
+        if not status and not notes:
+            return True
+        batches = ((self._UPDATE_STATUS_SQL, status), (self._UPDATE_NOTES_SQL, notes))
+        conn = None
+        try:
+            conn = self._conn()
+            with self._write_lock:
+                try:
+                    for sql, pending in batches:
+                        if pending:
+                            conn.executemany(sql, [(value, resource_id)
+                                                   for resource_id, value in pending.items()])
+                except sqlite3.OperationalError:
+                    raise
+                except Exception:
+                    # One value SQLite can't bind fails the whole executemany,
+                    # so redo the batch row by row and drop only the bad rows.
+                    conn.rollback()
+                    self._write_rows(conn, batches)
+                conn.commit()
+        except sqlite3.OperationalError as e:
+            # Locked, busy or unreachable: requeue the batch, keeping
+            # anything queued since it was taken, and retry later
+            with self._pending_lock:
+                for resource_id, value in status.items():
+                    self._pending_status.setdefault(resource_id, value)
+                for resource_id, value in notes.items():
+                    self._pending_notes.setdefault(resource_id, value)
+            if conn is not None:
+                conn.rollback()
+            print(f"Error saving queued updates: {e}")
+            return False
+        return True
+    
+    def _write_rows(self, conn, batches):
+        for sql, pending in batches:
+            for resource_id, value in list(pending.items()):
+                try:
+                    conn.execute(sql, (value, resource_id))
+                except sqlite3.OperationalError:
+                    raise
+                except Exception as e:
+                    # Dropped from the batch so a retry doesn't requeue it
+                    del pending[resource_id]
+                    print(f"Dropping queued update for resource {resource_id}: {e}")
 
 # Flask web interface
 app = Flask(__name__)
+# jsonify would otherwise indent its output whenever debug mode is on
+app.json.compact = True
+# resources.html is regenerated from html_template at startup, so debug
+# mode needn't stat it on every render to look for edits.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
 db = resourceDatabase()
+# Rendered responses keyed by route: (db.write_gen, body). Until the next
+# write from any process, repeat GETs cost one single-row version read.
+_response_cache = {}
+# gzip-compressed copies of cached bodies: key -> (db.write_gen, bytes)
+_gzip_cache = {}
+
+def _cached_stream(key, gen, chunks):
+    """Yield chunks as they are produced, caching the body once all are sent"""
+    sent = []
+    for chunk in chunks:
+        sent.append(chunk)
+        yield chunk
+    # Only a fully sent body is cached
+    _response_cache[key] = (gen, ''.join(sent))
+
+def _coalesce(pieces, size=HTML_CHUNK_SIZE):
+    """Join the small pieces Jinja emits into chunks of at least size"""
+    buf, length = [], 0
+    for piece in pieces:
+        buf.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield ''.join(buf)
+            buf, length = [], 0
+    if buf:
+        yield ''.join(buf)
 
 @app.route('/')
 def index():
-    return render_template('resources.html', resources=db.get_all_resources().to_dict('records'))
+    gen = db.write_gen
+    hit = _response_cache.get('index')
+    if hit and hit[0] == gen:
+        return hit[1]
+    # Render while rows come off the cursor, so the first bytes go out
+    # before the whole table has been read.
+    page = stream_template('resources.html', resources=db.iter_resources())
+    return Response(_cached_stream('index', gen, _coalesce(page)))
 
 @app.route('/api/resources')
 def get_resources():
-    return jsonify(db.get_all_resources().to_dict('records'))
+    # Read the generation before scanning: if a write lands mid-scan the
+    # body is cached under the old generation and rebuilt next time.
+    gen = db.write_gen
+    hit = _response_cache.get('api_resources')
+    if hit and hit[0] == gen:
+        if request.accept_encodings['gzip']:
+            # Compress once per write generation, on the first hit that
+            # wants it, and send the same bytes until the next write.
+            gz = _gzip_cache.get('api_resources')
+            if gz is None or gz[0] != gen:
+                gz = (gen, gzip.compress(hit[1].encode(), compresslevel=6))
+                _gzip_cache['api_resources'] = gz
+            response = Response(gz[1], mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(hit[1], mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        return response
+    def generate():
+        # Join rows into a few large chunks so the server isn't issuing a
+        # socket write per resource.
+        yield '['
+        batch, sep = [], ''
+        for resource in db.iter_resources():
+            batch.append(_encode_json(resource))
+            if len(batch) == JSON_BATCH_ROWS:
+                yield sep + ','.join(batch)
+                batch, sep = [], ','
+        if batch:
+            yield sep + ','.join(batch)
+        yield ']'
+    response = Response(stream_with_context(_cached_stream('api_resources', gen, generate())),
+                        mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/resources/<int:resource_id>/status/<status>', methods=['POST'])
 def update_status(resource_id, status):
     db.update_resource_status(resource_id, status)
     return jsonify({'success': True})
 
+@app.route('/api/resources/<int:resource_id>/notes', methods=['POST'])
+def update_notes(resource_id):
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object with "notes".'}), 400
+    notes = data.get('notes', '')
+    # null clears the note; anything else but a string can't be stored
+    if notes is not None and not isinstance(notes, str):
+        return jsonify({'error': '"notes" must be a string or null.'}), 400
+    db.add_resource_note(resource_id, notes)
+    return jsonify({'success': True})
+
 # HTML template for the web interface
 html_template = """
 <!DOCTYPE html>
@@ -197,9 +483,24 @@ html_template = """
 </html>
 """
 
-# Save the template
-with open('templates/resources.html', 'w') as f:
-    f.write(html_template)
+def _ensure_template():
+    """Write resources.html into the app's template folder if it differs"""
+    path = os.path.join(app.root_path, app.template_folder, 'resources.html')
+    try:
+        with open(path) as f:
+            if f.read() == html_template:
+                return
+    except FileNotFoundError:
+        pass
+    # Write then rename, so a worker loading the template concurrently
+    # never reads a half-written file.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(html_template)
+    os.replace(tmp_path, path)
+
+# Save the template; imports after the first find it current and skip the write
+_ensure_template()
 
 # Modified resourcesearchTester to use database
 class resourcesearchTester:
@@ -0,0 +1,3 @@
+# WSGI entry point for production servers, e.g.:
+#     gunicorn -w 4 -k gthread --threads 8 wsgi:app
+from resource_scout import app